@@ -5,6 +5,7 @@ import torch
 import numpy as np
 
 from elektronn3.models.unet import UNet
+from elektronn3.models._model_utils import fuse_conv_bn
 
 
 torch.backends.cudnn.benchmark = True
@@ -12,6 +13,7 @@ torch.backends.cudnn.benchmark = True
 print(' == Setting up...')
 
 jit = False
+fuse_bn = False  # Fold BatchNorm into conv weights (implies eval mode)
 
 # Determine input sizes for optimal VRAM usage
 cluster = os.getenv('CLUSTER', default='UNKNOWN')
@@ -69,6 +71,8 @@ def benchmark(float16, inp_shape):
         normalization='batch',
         # conv_mode='valid',
     ).to(device, dtype)
+    if fuse_bn:
+        model = fuse_conv_bn(model.eval())
     if jit:
         model = torch.jit.script(model)
 
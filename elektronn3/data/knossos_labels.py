@@ -169,9 +169,11 @@ class KnossosLabels(torch.utils.data.Dataset):
             'fname': target['fname']
         }
         if self.label_order is not None:
-            sample_target = sample['target'].detach().clone()
-            for i, label in enumerate(self.label_order):
-                sample['target'][sample_target == i] = label
+            # Lookup table mapping class i to label_order[i], other values are kept as they are
+            num_labels = len(self.label_order)
+            lut = torch.arange(max(int(sample['target'].max()) + 1, num_labels))
+            lut[:num_labels] = torch.as_tensor(self.label_order)
+            sample['target'] = lut[sample['target']]
         return sample
 
     def __len__(self) -> int:
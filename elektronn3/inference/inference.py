@@ -16,6 +16,7 @@ from pathlib import Path
 import numpy as np
 import torch
 from torch import nn
+from torch.cuda import amp
 from tqdm import tqdm
 
 from elektronn3.data import utils
@@ -323,6 +324,11 @@ class Predictor:
             >>> out_shape = (out_channels, *inp.shape[2:])
         out_dtype: torch dtype that the output will be cast to
         float16: If ``True``, deploy the model in float16 (half) precision.
+        mixed_precision: If ``True``, run model forward passes under
+            ``torch.cuda.amp.autocast``. In contrast to ``float16``, the model
+            parameters are kept in float32 and precision-sensitive ops are
+            still computed in float32, so this is a safer way to speed up
+            inference on GPUs with Tensor Cores.
         apply_softmax: If ``True``
             (default), a softmax operator is automatically appended to the
             model, in order to get probability tensors as inference outputs
@@ -377,6 +383,7 @@ class Predictor:
             out_shape: Optional[Tuple[int, ...]] = None,
             out_dtype: Optional[torch.dtype] = None,
             float16: bool = False,
+            mixed_precision: bool = False,
             apply_softmax: bool = True,
             transform: Optional[Transform] = None,
             augmentations: Union[int, Optional[Sequence]] = None,
@@ -396,6 +403,7 @@ class Predictor:
 
         self.out_dtype = out_dtype
         self.float16 = float16
+        self.mixed_precision = mixed_precision
 
         if isinstance(model, Path):
             model = str(model)
@@ -496,7 +504,8 @@ class Predictor:
     @torch.no_grad()
     def _predict(self, dinp: torch.Tensor, crop_slice=None) -> torch.Tensor:
         dinp = dinp.to(self.device, dtype=self.dtype)
-        dout = self.model(dinp)
+        with amp.autocast(enabled=self.mixed_precision):
+            dout = self.model(dinp)
         if crop_slice is not None:
             dout = dout[crop_slice]
 
@@ -508,7 +517,8 @@ class Predictor:
             douts = [dout]
             for aug in self.augmentations:
                 dinp_aug = aug.forward(dinp)
-                dout_aug = self.model(dinp_aug.to(self.device))
+                with amp.autocast(enabled=self.mixed_precision):
+                    dout_aug = self.model(dinp_aug)
                 dout = aug.backward(dout_aug)
                 if crop_slice:
                     dout = dout[crop_slice]
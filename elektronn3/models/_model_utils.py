@@ -110,6 +110,55 @@ def change_conv1_input_channels(
     )
 
 
+def fuse_conv_bn(model: nn.Module) -> nn.Module:
+    """Fold BatchNorm layers into the convolutions that directly precede them (in-place).
+
+    In eval mode, batch normalization is just a fixed per-channel affine
+    transform, so it can be merged into the weights and bias of the
+    preceding convolution, saving one pass over each feature map.
+    The fused BatchNorm layers are replaced by ``nn.Identity``.
+
+    Conv-BN pairs are found in two places:
+
+    - Consecutive ``(ConvNd, BatchNormNd)`` children of ``nn.Sequential``
+      containers.
+    - Submodules that declare the attribute names of their conv-norm pairs
+      in a ``_conv_norm_pairs`` class attribute (see
+      :py:class:`elektronn3.models.unet.DownConv`).
+
+    Pairs whose norm layer is not a standard BatchNorm with running
+    statistics (e.g. group norm or ``nn.Identity``) are left untouched.
+
+    Only use the fused model for inference. It can't be trained anymore.
+
+    Example::
+    >>> from elektronn3.models._model_utils import fuse_conv_bn
+    >>> from elektronn3.models.unet import UNet
+    >>> model = UNet(normalization='batch')
+    >>> # (Train model here)
+    >>> model = fuse_conv_bn(model.eval())
+    """
+    if model.training:
+        raise ValueError('Conv-BN fusion is only valid in eval mode. Call model.eval() first.')
+    from torch.nn.utils.fusion import fuse_conv_bn_eval
+    conv_types = (nn.Conv1d, nn.Conv2d, nn.Conv3d)
+    bn_types = (nn.BatchNorm1d, nn.BatchNorm2d, nn.BatchNorm3d)
+    for mod in list(model.modules()):
+        if isinstance(mod, nn.Sequential):
+            names = list(mod._modules.keys())
+            pairs = zip(names[:-1], names[1:])
+        else:
+            pairs = getattr(mod, '_conv_norm_pairs', ())
+        for conv_name, bn_name in pairs:
+            conv = getattr(mod, conv_name)
+            bn = getattr(mod, bn_name)
+            # Exact BatchNorm types only: Subclasses may override forward() (see vnet.ContBatchNorm3d)
+            if type(conv) in conv_types and type(bn) in bn_types and bn.track_running_stats:
+                setattr(mod, conv_name, fuse_conv_bn_eval(conv, bn))
+                setattr(mod, bn_name, nn.Identity())
+    return model
+
+
 def num_params(model: torch.nn.Module) -> int:
     """Total number of trainable parameters."""
     return sum(p.numel() for p in model.parameters() if p.requires_grad)
@@ -210,6 +210,10 @@ def get_padding(conv_mode, kernel_size):
 
 
 class ConvBlock(nn.Module):
+    # Conv-norm pairs that can be fused at eval time, see _model_utils.fuse_conv_bn()
+    # (conv2 and norm2 are separated by the residual addition)
+    _conv_norm_pairs = (('conv1', 'norm1'),)
+
     def __init__(
             self,
             in_channels,
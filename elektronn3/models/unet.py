@@ -204,6 +204,9 @@ class DownConv(nn.Module):
     A helper Module that performs 2 convolutions and 1 MaxPool.
     A ReLU activation follows each convolution.
     """
+    # Conv-norm pairs that can be fused at eval time, see _model_utils.fuse_conv_bn()
+    _conv_norm_pairs = (('conv1', 'norm0'), ('conv2', 'norm1'))
+
     def __init__(self, in_channels, out_channels, pooling=True, planar=False, activation='relu',
                  normalization=None, full_norm=True, dim=3, conv_mode='same'):
         super().__init__()
@@ -333,6 +336,9 @@ class UpConv(nn.Module):
 
     att: Optional[torch.Tensor]
 
+    # Conv-norm pairs that can be fused at eval time, see _model_utils.fuse_conv_bn()
+    _conv_norm_pairs = (('conv1', 'norm1'), ('conv2', 'norm2'))
+
     def __init__(self, in_channels, out_channels,
                  merge_mode='concat', up_mode='transpose', planar=False,
                  activation='relu', normalization=None, full_norm=True, dim=3, conv_mode='same',
@@ -5,6 +5,7 @@ from operator import itemgetter
 
 import torch
 from torch import nn
+from torch.nn import functional as F
 from torch.autograd.function import Function
 from torch.utils.checkpoint import get_device_states, set_device_states
 
@@ -140,9 +141,13 @@ class SelfAttention(nn.Module):
         merge_heads = lambda x: x.reshape(b, -1, h, e).transpose(1, 2).reshape(b * h, -1, e)
         q, k, v = map(merge_heads, (q, k, v))
 
-        dots = torch.einsum('bie,bje->bij', q, k) * (e ** -0.5)
-        dots = dots.softmax(dim=-1)
-        out = torch.einsum('bij,bje->bie', dots, v)
+        if hasattr(F, 'scaled_dot_product_attention'):
+            # Fused kernel (torch >= 2.0), avoids materializing the attention matrix
+            out = F.scaled_dot_product_attention(q, k, v)
+        else:
+            dots = torch.einsum('bie,bje->bij', q, k) * (e ** -0.5)
+            dots = dots.softmax(dim=-1)
+            out = torch.einsum('bij,bje->bie', dots, v)
 
         out = out.reshape(b, h, -1, e).transpose(1, 2).reshape(b, -1, d)
         out = self.to_out(out)
@@ -119,7 +119,8 @@ class Noise2VoidTrainer(Trainer):
         if self.n2v_ratio > 0:
             dinp, dtarget, dmask = prepare_sample(dimg, ratio=self.n2v_ratio)
         else:
-            dinp = dimg.clone()
+            # Only copy if dinp is going to be modified in-place below
+            dinp = dimg.clone() if self.agn_max_std > 0 or self.gblur_sigma > 0 else dimg
             dtarget = dimg
             dmask = None
 
@@ -173,7 +174,8 @@ class Noise2VoidTrainer(Trainer):
             if self.n2v_ratio > 0:
                 dinp, dtarget, dmask = prepare_sample(dimg, ratio=self.n2v_ratio)
             else:
-                dinp = dimg.clone()
+                # Only copy if dinp is going to be modified in-place below
+                dinp = dimg.clone() if self.agn_max_std > 0 or self.gblur_sigma > 0 else dimg
                 dtarget = dimg
                 dmask = None
 